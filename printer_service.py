@@ -3,6 +3,15 @@ from click.core import F
 from escpos.printer import Network
 from escpos.exceptions import Error as EscposError
 from models import PrintStationGroup, InvoiceRequest
+from ticket_layout import (
+    INVOICE_WIDTH,
+    TicketBuilder,
+    invoice_footer,
+    invoice_header,
+    order_footer,
+    order_separator,
+    station_header,
+)
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -58,35 +67,35 @@ class PrinterService:
             # Configurar codificación para caracteres especiales
             printer.charcode("CP858")
 
+            ticket = TicketBuilder(self.encoding)
+
             # Encabezado con el nombre de la estación
-            printer.set(
-                align="center", bold=True, double_width=True, double_height=True
+            ticket.insert(
+                station_header(
+                    station_group.print_station.name, ticket.style, self.encoding
+                )
             )
-            printer.text(f"{station_group.print_station.name}\n")
-            printer.text("=" * 24 + "\n")
 
             # Información de la orden (fuente pequeña)
-            printer.set(
+            ticket.set(
                 align="left",
                 bold=False,
                 double_width=False,
                 double_height=False,
                 font="b",
             )
-            printer.text(f"Orden: #{order_data['order_id']}\n")
-            printer.text(f"Mesa: {order_data['table_number']}\n")
-            printer.text(f"Numero de personas: {order_data['diners_count']}\n")
-            printer.text(f"Mesero: {order_data['waiter_name']}\n")
-            printer.text(
+            ticket.text(f"Orden: #{order_data['order_id']}\n")
+            ticket.text(f"Mesa: {order_data['table_number']}\n")
+            ticket.text(f"Numero de personas: {order_data['diners_count']}\n")
+            ticket.text(f"Mesero: {order_data['waiter_name']}\n")
+            ticket.text(
                 f"{datetime.now(ZoneInfo('America/Bogota')).strftime('%d/%m/%Y %I:%M %p').lower()}\n"
             )
 
             if order_data.get("order_notes"):
-                printer.text(f"Notas: {order_data['order_notes']}\n")
+                ticket.text(f"Notas: {order_data['order_notes']}\n")
 
-            # Resetear fuente a normal
-            printer.set(font="a")
-            printer.text("-" * 24 + "\n")
+            ticket.insert(order_separator(ticket.style, self.encoding))
 
             # Agrupar items por nombre para consolidar cantidades
             items_consolidated = {}
@@ -113,33 +122,36 @@ class PrinterService:
                 items_consolidated[item_key]["quantity"] += item.quantity
 
             # Items de la comanda consolidados
-            printer.set(
+            ticket.set(
                 align="left", bold=False, double_width=False, double_height=False
             )
             for item_data in items_consolidated.values():
                 # Nombre del item y cantidad
-                printer.set(bold=True, double_height=True)
-                printer.text(
+                ticket.set(bold=True, double_height=True)
+                ticket.text(
                     f"{item_data['quantity']}x {item_data['menu_item_name']}\n"
                 )
 
                 # Punto de cocción si existe
                 if item_data["cooking_point"]:
-                    printer.set(bold=False, double_height=False)
-                    printer.text(f"   Cocción: {item_data['cooking_point'].name}\n")
+                    ticket.set(bold=False, double_height=False)
+                    ticket.text(f"   Cocción: {item_data['cooking_point'].name}\n")
 
                 # Acompañamientos
                 if item_data["sides"]:
                     sides_text = ", ".join([side.name for side in item_data["sides"]])
-                    printer.text(f"   Con: {sides_text}\n")
+                    ticket.text(f"   Con: {sides_text}\n")
 
                 # Notas del item
                 if item_data["notes"]:
-                    printer.text(f"   Nota: {item_data['notes']}\n")
+                    ticket.text(f"   Nota: {item_data['notes']}\n")
 
-                printer.text("\n")
+                ticket.text("\n")
 
-            printer.text("-" * 40 + "\n")
+            ticket.insert(order_footer(ticket.style, self.encoding))
+
+            # Enviar el ticket completo en una sola escritura
+            printer._raw(ticket.getvalue())
 
             # Cortar papel
             printer.cut()
@@ -165,36 +177,18 @@ class PrinterService:
             printer = Network(printer_ip)
             printer.charcode("CP858")
 
+            ticket = TicketBuilder(self.encoding)
+
             # Configurar fuente pequeña y compacta
-            printer._raw(b"\x1b\x21\x00")  # Reset font settings
+            ticket.reset_mode()
 
-            # Encabezado de factura - compacto
-            printer.set(
-                align="center",
-                bold=True,
-                double_width=False,
-                double_height=False,
-                font="a",
+            # Encabezado de factura con datos del restaurante - compacto
+            ticket.insert(
+                invoice_header(invoice_data.restaurant_info, ticket.style, self.encoding)
             )
-            printer.text(f"{invoice_data.restaurant_info.name}\n")
-            printer.text("=" * 42 + "\n")
-
-            # Información del restaurante - fuente pequeña
-            if invoice_data.restaurant_info:
-                printer.set(
-                    align="center",
-                    bold=False,
-                    double_width=False,
-                    double_height=False,
-                    font="a",
-                )
-                printer.text(f"{invoice_data.restaurant_info.address}\n")
-                printer.text(f"Tel: {invoice_data.restaurant_info.phone}\n")
-                printer.text(f"{invoice_data.restaurant_info.tax_id}\n")
-                printer.text("-" * 42 + "\n")
 
             # Información de la orden - fuente pequeña
-            printer.set(
+            ticket.set(
                 align="left",
                 bold=False,
                 double_width=False,
@@ -202,18 +196,18 @@ class PrinterService:
                 font="a",
             )
             invoice_number = f"FAC-{invoice_data.order_id}-{datetime.now(ZoneInfo('America/Bogota')).strftime('%Y%m%d%H%M')}"
-            printer.text(f"Factura: {invoice_number}\n")
-            printer.text(f"Orden: #{invoice_data.order_id}\n")
-            printer.text(f"Mesa: {invoice_data.table_number}\n")
-            printer.text(f"Comensales: {invoice_data.diners_count}\n")
-            printer.text(f"Mesero: {invoice_data.waiter_name}\n")
-            printer.text(
+            ticket.text(f"Factura: {invoice_number}\n")
+            ticket.text(f"Orden: #{invoice_data.order_id}\n")
+            ticket.text(f"Mesa: {invoice_data.table_number}\n")
+            ticket.text(f"Comensales: {invoice_data.diners_count}\n")
+            ticket.text(f"Mesero: {invoice_data.waiter_name}\n")
+            ticket.text(
                 f"Fecha: {datetime.now(ZoneInfo('America/Bogota')).strftime('%d/%m/%Y %I:%M %p').lower()}\n"
             )
-            printer.text("-" * 42 + "\n")
+            ticket.text("-" * INVOICE_WIDTH + "\n")
 
             # Items facturados - formato compacto
-            printer.set(
+            ticket.set(
                 align="left",
                 bold=False,
                 double_width=False,
@@ -221,48 +215,41 @@ class PrinterService:
                 font="a",
             )
             for item in invoice_data.items:
-                printer.text(f"{item.quantity}x {item.menu_item_name}\n")
+                ticket.text(f"{item.quantity}x {item.menu_item_name}\n")
 
                 # Precio unitario y total en línea compacta
                 price_text = f"  ${item.unit_price:,.0f} c/u"
                 total_text = f"${item.subtotal:,.0f}"
-                spaces_needed = 42 - len(price_text) - len(total_text)
-                printer.text(
+                spaces_needed = INVOICE_WIDTH - len(price_text) - len(total_text)
+                ticket.text(
                     f"{price_text}" + " " * max(1, spaces_needed) + f"{total_text}\n"
                 )
 
-            printer.text("-" * 42 + "\n")
+            ticket.text("-" * INVOICE_WIDTH + "\n")
 
             # Totales - fuente pequeña
-            printer.set(
+            ticket.set(
                 align="right",
                 bold=False,
                 double_width=False,
                 double_height=False,
                 font="a",
             )
-            printer.text(f"Subtotal: {self.format_currency(invoice_data.subtotal)}\n")
-            printer.text(f"INC: {self.format_currency(invoice_data.tax_amount)}\n")
-            printer.text(f"Propina: {self.format_currency(invoice_data.tip_amount)}\n")
+            ticket.text(f"Subtotal: {self.format_currency(invoice_data.subtotal)}\n")
+            ticket.text(f"INC: {self.format_currency(invoice_data.tax_amount)}\n")
+            ticket.text(f"Propina: {self.format_currency(invoice_data.tip_amount)}\n")
 
             # Total final solo en negrita
-            printer.set(bold=True, font="a")
-            printer.text(
+            ticket.set(bold=True, font="a")
+            ticket.text(
                 f"Total a pagar: {self.format_currency(invoice_data.grand_total)}\n"
             )
 
             # Pie de página - fuente pequeña
-            printer.text("\n")
-            printer.set(
-                align="center",
-                bold=False,
-                double_width=False,
-                double_height=False,
-                font="a",
-            )
-            printer.text("¡Gracias por su visita!\n")
-            printer.text("Vuelva pronto\n")
-            printer.text("=" * 42 + "\n")
+            ticket.insert(invoice_footer(ticket.style, self.encoding))
+
+            # Enviar el ticket completo en una sola escritura
+            printer._raw(ticket.getvalue())
 
             # Cortar papel
             printer.cut()
@@ -0,0 +1,96 @@
+from models import RestaurantInfo
+from ticket_layout import (
+    UNKNOWN_STYLE,
+    TextStyle,
+    TicketBuilder,
+    invoice_footer,
+    invoice_header,
+    order_footer,
+    order_separator,
+    station_header,
+)
+
+
+def test_comanda_bytes():
+    """Misma secuencia que print_order_to_station con un item con cocción"""
+    ticket = TicketBuilder("cp858")
+    ticket.insert(station_header("Cocina", ticket.style, "cp858"))
+    ticket.set(
+        align="left", bold=False, double_width=False, double_height=False, font="b"
+    )
+    ticket.text("Orden: #1\n")
+    ticket.insert(order_separator(ticket.style, "cp858"))
+    ticket.set(align="left", bold=False, double_width=False, double_height=False)
+    ticket.set(bold=True, double_height=True)
+    ticket.text("2x Lomo\n")
+    ticket.set(bold=False, double_height=False)
+    ticket.text("   Cocción: Medio\n")
+    ticket.text("\n")
+    ticket.insert(order_footer(ticket.style, "cp858"))
+
+    assert ticket.getvalue() == (
+        # Doble ancho y alto en negrita, centrado
+        b"\x1b!\x38\x1ba\x01Cocina\n" + b"=" * 24 + b"\n"
+        # False en double_* no cambia el tamaño: fuente B sigue en doble tamaño
+        + b"\x1b!\x31\x1ba\x00Orden: #1\n"
+        + b"\x1b!\x30" + b"-" * 24 + b"\n"
+        # Solo doble alto: el ancho vuelve a normal
+        + b"\x1b!\x182x Lomo\n"
+        + b"\x1b!\x10   Cocci\xa2n: Medio\n\n"
+        + b"-" * 40 + b"\n"
+    )
+
+
+def test_invoice_bytes():
+    restaurant = RestaurantInfo(
+        name="Salón", address="Calle 1", phone="123", tax_id="NIT 9"
+    )
+    ticket = TicketBuilder("cp858")
+    ticket.reset_mode()
+    ticket.insert(invoice_header(restaurant, ticket.style, "cp858"))
+    ticket.set(
+        align="left", bold=False, double_width=False, double_height=False, font="a"
+    )
+    ticket.text("Orden: #1\n")
+    ticket.set(
+        align="right", bold=False, double_width=False, double_height=False, font="a"
+    )
+    ticket.text("Subtotal: $1\n")
+    ticket.set(bold=True, font="a")
+    ticket.text("Total a pagar: $1\n")
+    ticket.insert(invoice_footer(ticket.style, "cp858"))
+
+    assert ticket.getvalue() == (
+        b"\x1b!\x00"
+        + b"\x1b!\x08\x1ba\x01Sal\xa2n\n" + b"=" * 42 + b"\n"
+        + b"\x1b!\x00Calle 1\nTel: 123\nNIT 9\n" + b"-" * 42 + b"\n"
+        + b"\x1ba\x00Orden: #1\n"
+        + b"\x1ba\x02Subtotal: $1\n"
+        + b"\x1b!\x08Total a pagar: $1\n"
+        + b"\n\x1b!\x00\x1ba\x01\xadGracias por su visita!\nVuelva pronto\n"
+        + b"=" * 42 + b"\n"
+    )
+
+
+def test_set_without_known_size_sends_individual_commands():
+    ticket = TicketBuilder("cp858")
+    ticket.set(bold=True, font="b", double_width=False, double_height=False)
+    ticket.set(bold=True, font="b")
+
+    assert ticket.getvalue() == b"\x1bE\x01\x1bM\x01"
+
+
+def test_segments_are_cached_per_entry_style():
+    normal = TextStyle(
+        align="center", bold=False, double_width=False, double_height=False, font="a"
+    )
+
+    assert station_header("Bar", UNKNOWN_STYLE, "cp858") is station_header(
+        "Bar", UNKNOWN_STYLE, "cp858"
+    )
+    assert station_header("Bar", normal, "cp858").data == (
+        b"\x1b!\x38Bar\n" + b"=" * 24 + b"\n"
+    )
+    assert station_header("Bar", UNKNOWN_STYLE, "cp858").data == (
+        b"\x1b!\x38\x1ba\x01Bar\n" + b"=" * 24 + b"\n"
+    )
@@ -0,0 +1,248 @@
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Callable, Optional
+from models import RestaurantInfo
+
+
+# Comandos ESC/POS usados para el estilo del texto
+ESC = b"\x1b"
+ALIGN_CODES = {"left": b"\x00", "center": b"\x01", "right": b"\x02"}
+FONT_BITS = {"a": 0x00, "b": 0x01}
+BOLD_BIT = 0x08
+DOUBLE_HEIGHT_BIT = 0x10
+DOUBLE_WIDTH_BIT = 0x20
+
+# Anchos de línea de cada tipo de ticket
+INVOICE_WIDTH = 42
+STATION_RULE_WIDTH = 24
+ORDER_FOOTER_WIDTH = 40
+
+
+@dataclass(frozen=True)
+class TextStyle:
+    """Estado de estilo de la impresora. None significa estado desconocido"""
+
+    align: Optional[str] = None
+    bold: Optional[bool] = None
+    double_width: Optional[bool] = None
+    double_height: Optional[bool] = None
+    font: Optional[str] = None
+
+
+# Estado al abrir la conexión: no se sabe qué dejó el trabajo anterior
+UNKNOWN_STYLE = TextStyle()
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Bytes precompilados de una parte fija del ticket"""
+
+    data: bytes
+    style: TextStyle  # Estilo en que queda la impresora al terminar el segmento
+
+
+class TicketBuilder:
+    """Arma un ticket en memoria emitiendo solo los cambios de estilo necesarios"""
+
+    def __init__(self, encoding: str = "cp858", style: TextStyle = UNKNOWN_STYLE):
+        self.encoding = encoding
+        self.style = style
+        self._buffer = bytearray()
+
+    def set(
+        self,
+        align: Optional[str] = None,
+        bold: Optional[bool] = None,
+        double_width: Optional[bool] = None,
+        double_height: Optional[bool] = None,
+        font: Optional[str] = None,
+    ) -> None:
+        """Equivalente a printer.set(...) de python-escpos 3.0, pero sin repetir
+        modos que no cambian.
+
+        Como en escpos, el tamaño solo cambia si double_width o double_height
+        es verdadero; pasar False en ambos no modifica el tamaño actual. Al
+        cambiar el tamaño la impresora vuelve a negrita desactivada y fuente A,
+        salvo que se indiquen en la misma llamada.
+        """
+        target = self.style
+        if double_width or double_height:
+            target = replace(
+                target,
+                double_width=bool(double_width),
+                double_height=bool(double_height),
+                bold=False,
+                font="a",
+            )
+        if bold is not None:
+            target = replace(target, bold=bold)
+        if font is not None:
+            target = replace(target, font=font)
+
+        mode_fields = ("bold", "double_width", "double_height", "font")
+        changed = [
+            name
+            for name in mode_fields
+            if getattr(target, name) != getattr(self.style, name)
+        ]
+        if changed and all(getattr(target, name) is not None for name in mode_fields):
+            # ESC ! fija fuente, negrita y tamaño en un solo comando
+            mode = FONT_BITS[target.font]
+            if target.bold:
+                mode |= BOLD_BIT
+            if target.double_height:
+                mode |= DOUBLE_HEIGHT_BIT
+            if target.double_width:
+                mode |= DOUBLE_WIDTH_BIT
+            self._buffer += ESC + b"!" + bytes([mode])
+        else:
+            # Tamaño desconocido: solo se envían los comandos individuales
+            if "bold" in changed:
+                self._buffer += ESC + b"E" + bytes([target.bold])
+            if "font" in changed:
+                self._buffer += ESC + b"M" + bytes([FONT_BITS[target.font]])
+
+        if align is not None and align != target.align:
+            self._buffer += ESC + b"a" + ALIGN_CODES[align]
+            target = replace(target, align=align)
+
+        self.style = target
+
+    def reset_mode(self) -> None:
+        """Vuelve la impresora a fuente A, sin negrita y tamaño normal"""
+        self._buffer += ESC + b"!\x00"
+        self.style = replace(
+            self.style, bold=False, double_width=False, double_height=False, font="a"
+        )
+
+    def text(self, txt: str) -> None:
+        self._buffer += txt.encode(self.encoding, errors="replace")
+
+    def insert(self, segment: Segment) -> None:
+        """Copia un segmento precompilado y adopta su estilo final"""
+        self._buffer += segment.data
+        self.style = segment.style
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+
+def compile_segment(
+    render: Callable[[TicketBuilder], None], entry: TextStyle, encoding: str
+) -> Segment:
+    """Ejecuta una plantilla sobre un builder vacío y guarda el resultado"""
+    builder = TicketBuilder(encoding, entry)
+    render(builder)
+    return Segment(builder.getvalue(), builder.style)
+
+
+# Plantillas de factura
+
+
+def invoice_header(
+    restaurant_info: RestaurantInfo, entry: TextStyle, encoding: str
+) -> Segment:
+    """Encabezado de factura con los datos del restaurante"""
+    key = (
+        restaurant_info.name,
+        restaurant_info.address,
+        restaurant_info.phone,
+        restaurant_info.tax_id,
+    )
+    return _compile_invoice_header(key, entry, encoding)
+
+
+@lru_cache(maxsize=32)
+def _compile_invoice_header(
+    restaurant: tuple[str, str, str, str], entry: TextStyle, encoding: str
+) -> Segment:
+    name, address, phone, tax_id = restaurant
+
+    def render(builder: TicketBuilder) -> None:
+        builder.set(
+            align="center",
+            bold=True,
+            double_width=False,
+            double_height=False,
+            font="a",
+        )
+        builder.text(f"{name}\n")
+        builder.text("=" * INVOICE_WIDTH + "\n")
+
+        # Información del restaurante - fuente pequeña
+        builder.set(
+            align="center",
+            bold=False,
+            double_width=False,
+            double_height=False,
+            font="a",
+        )
+        builder.text(f"{address}\n")
+        builder.text(f"Tel: {phone}\n")
+        builder.text(f"{tax_id}\n")
+        builder.text("-" * INVOICE_WIDTH + "\n")
+
+    return compile_segment(render, entry, encoding)
+
+
+@lru_cache(maxsize=8)
+def invoice_footer(entry: TextStyle, encoding: str) -> Segment:
+    """Pie de página de la factura"""
+
+    def render(builder: TicketBuilder) -> None:
+        builder.text("\n")
+        builder.set(
+            align="center",
+            bold=False,
+            double_width=False,
+            double_height=False,
+            font="a",
+        )
+        builder.text("¡Gracias por su visita!\n")
+        builder.text("Vuelva pronto\n")
+        builder.text("=" * INVOICE_WIDTH + "\n")
+
+    return compile_segment(render, entry, encoding)
+
+
+# Plantillas de comanda
+
+
+@lru_cache(maxsize=32)
+def station_header(station_name: str, entry: TextStyle, encoding: str) -> Segment:
+    """Encabezado de comanda con el nombre de la estación"""
+
+    def render(builder: TicketBuilder) -> None:
+        builder.set(
+            align="center",
+            bold=True,
+            double_width=True,
+            double_height=True,
+            font="a",
+        )
+        builder.text(f"{station_name}\n")
+        builder.text("=" * STATION_RULE_WIDTH + "\n")
+
+    return compile_segment(render, entry, encoding)
+
+
+@lru_cache(maxsize=8)
+def order_separator(entry: TextStyle, encoding: str) -> Segment:
+    """Separador entre la información de la orden y los items"""
+
+    def render(builder: TicketBuilder) -> None:
+        # Resetear fuente a normal
+        builder.set(font="a")
+        builder.text("-" * STATION_RULE_WIDTH + "\n")
+
+    return compile_segment(render, entry, encoding)
+
+
+@lru_cache(maxsize=8)
+def order_footer(entry: TextStyle, encoding: str) -> Segment:
+    """Línea de cierre de la comanda"""
+
+    def render(builder: TicketBuilder) -> None:
+        builder.text("-" * ORDER_FOOTER_WIDTH + "\n")
+
+    return compile_segment(render, entry, encoding)